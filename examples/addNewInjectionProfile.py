@@ -12,8 +12,8 @@ injection_profiles_from_solmate = injection_profiles_settings_from_solmate["inje
 # define new injection profile where key is the name displayed in the App
 new_injection_profile = {
     "my awesome test profile": {
-        "min": [0.2 for _ in range(24)],
-        "max": [0.8 for _ in range(24)],
+        "min": [0.2] * 24,
+        "max": [0.8] * 24,
     }
 }
 # extend injection profiles with new injection profile
@@ -1,9 +1,5 @@
-from solmate_sdk import SolMateAPIClient
+from solmate_sdk import get_shared_client
 
-client = SolMateAPIClient("test1")
-client.connect()
+client = get_shared_client("test1")
 print(f"Your SolMate online status is: {client.check_online()}")
-
-# or for the protected API:
-client.quickstart()
 print(client.get_live_values())
@@ -1,25 +1,22 @@
-from time import sleep
+import sys
+from time import monotonic, sleep
 
 import solmate_sdk
 
 SEPERATOR = ";"
 
-client = solmate_sdk.SolMateAPIClient("test1")
-client.quickstart()
+client = solmate_sdk.get_shared_client("test1")
 
 vals = client.get_live_values()
-keys = vals.keys()
-print("serial_number", end=SEPERATOR)
-for k in vals.keys():
-    print(k, end=SEPERATOR)
-print()
+keys = list(vals.keys())
+write = sys.stdout.write  # one write call (and stdout lock acquisition) per row
+write(SEPERATOR.join(["serial_number"] + keys) + "\n")
+PERIOD = 10.0
+next_tick = monotonic() + PERIOD
 while True:
     vals = client.get_live_values()
-    print(client.serialnum, end=SEPERATOR)
-    for k in keys:
-        if k in vals:
-            print(vals[k], end=SEPERATOR)
-        else:
-            print(" ", end=SEPERATOR)
-    print()
-    sleep(10)
+    write(SEPERATOR.join([client.serialnum] + [str(vals.get(k, " ")) for k in keys]) + "\n")
+    sys.stdout.flush()
+    # sleep until the next deadline so the sampling rate does not drift with network latency
+    sleep(max(0.0, next_tick - monotonic()))
+    next_tick += PERIOD
@@ -1,18 +1,25 @@
 import csv
-from time import sleep
+from time import monotonic, sleep
 
 import solmate_sdk
 
-client = solmate_sdk.SolMateAPIClient("test1")
-client.quickstart()
+FLUSH_EVERY = 10  # rows
+
+client = solmate_sdk.get_shared_client("test1")
 vals = client.get_live_values()
 keys = vals.keys()
-with open(f"{client.serialnum}.csv", "w") as csvfile:
+with open(f"{client.serialnum}.csv", "w", buffering=1 << 16, newline="") as csvfile:
     writer = csv.DictWriter(csvfile, fieldnames=keys)
     writer.writeheader()
     writer.writerow(vals)
-while True:
-    with open(f"{client.serialnum}.csv", "a") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=keys)
+    rows_written = 1
+    PERIOD = 10.0
+    next_tick = monotonic() + PERIOD
+    while True:
         writer.writerow(client.get_live_values())
-    sleep(10)
+        rows_written += 1
+        if rows_written % FLUSH_EVERY == 0:
+            csvfile.flush()
+        # sleep until the next deadline so the sampling rate does not drift with network latency
+        sleep(max(0.0, next_tick - monotonic()))
+        next_tick += PERIOD
@@ -2,8 +2,7 @@ from time import sleep
 
 import solmate_sdk
 
-client = solmate_sdk.SolMateAPIClient("test1")
-client.quickstart()
+client = solmate_sdk.get_shared_client("test1")
 while True:
     print(f"Solmate {client.serialnum}: {client.get_live_values()}")
     sleep(10)
@@ -1,8 +1,10 @@
-from time import sleep
+import asyncio
+from time import monotonic
 
 import paho.mqtt.client as mqtt
 
 import solmate_sdk
+from solmate_sdk.utils import dumps
 
 
 class config:
@@ -10,27 +12,40 @@ class config:
     mqtt_port = 1883
 
 
-client = solmate_sdk.SolMateAPIClient("test1")
-client.quickstart()
-
-
 def on_connect(client, userdata, flags, rc):
     print("Connected with result code " + str(rc))
 
 
-mqttClient = mqtt.Client()
-mqttClient.on_connect = on_connect
-mqttClient.connect(config.mqtt_host, config.mqtt_port, 60)
-while True:
-    print(".", end="", flush=True)
-    try:
-        live_values = client.get_live_values()
-        online = client.check_online()
-        # mqttClient.publish(f"eet/solmate/{client.serialnum}/live_values", json.dumps(live_values), 1)
-        # mqttClient.publish(f"eet/solmate/{client.serialnum}/online", online, 1)
-        for property_name in live_values.keys():
-            if property_name == "pv_power":
-                mqttClient.publish(f"eet/solmate/{client.serialnum}/{property_name}", live_values[property_name], 1)
-    except Exception as exc:
-        print(exc)
-    sleep(10)
+async def main():
+    client = solmate_sdk.SolMateAPIClient("test1", asynchronous=True)
+    await client.async_quickstart()
+
+    # a stable client id with a persistent session lets the broker reuse its
+    # per-client state instead of rebuilding it for every QoS-1 publish
+    mqttClient = mqtt.Client(client_id=f"solmate-{client.serialnum}", clean_session=False, protocol=mqtt.MQTTv311)
+    mqttClient.on_connect = on_connect
+    mqttClient.connect(config.mqtt_host, config.mqtt_port, 60)
+    mqttClient.loop_start()  # paho's network thread drains PUBACKs while we await the websocket
+
+    # the serial number never changes, so build the topics once instead of per tick
+    # (paho requires str topics; only payloads may be bytes)
+    live_values_topic = f"eet/solmate/{client.serialnum}/live_values"
+    online_topic = f"eet/solmate/{client.serialnum}/online"
+    period = 10.0
+    next_tick = monotonic() + period
+    while True:
+        print(".", end="", flush=True)
+        try:
+            live_values = await client.async_get_live_values()
+            online = await client.async_check_online()
+            # one JSON payload per poll instead of one publish (and PUBACK round-trip) per property
+            mqttClient.publish(live_values_topic, dumps(live_values), 1)
+            mqttClient.publish(online_topic, str(online).encode(), 1)
+        except Exception as exc:
+            print(exc)
+        # sleep until the next deadline so the publish rate does not drift with network latency
+        await asyncio.sleep(max(0.0, next_tick - monotonic()))
+        next_tick += period
+
+
+asyncio.run(main())
@@ -4,7 +4,6 @@ from websockets.exceptions import ConnectionClosedError
 
 import solmate_sdk
 from solmate_sdk.utils import retry
-from websockets.exceptions import ConnectionClosedError
 
 client = solmate_sdk.SolMateAPIClient("test1")
 
@@ -13,24 +12,13 @@ client = solmate_sdk.SolMateAPIClient("test1")
 def run_continuously():
     client.quickstart()
     while True:
-        print(f"Solmate {client.serialnum}: {client.get_live_values()}")
-        sleep(0.1)
+        # live values, grid mode, user settings and injection settings in one round-trip
+        for name, values in client.snapshot().items():
+            print(f"Solmate {client.serialnum} {name}: {values}")
         print(f"Solmate {client.serialnum}: {client.get_recent_logs()}")
-        sleep(0.1)
         print(f"Solmate {client.serialnum}: {client.get_software_version()}")
-        sleep(0.1)
-        print(f"Solmate {client.serialnum}: {client.get_grid_mode()}")
-        sleep(0.1)
-        print(f"Solmate {client.serialnum}: {client.get_user_settings()}")
-        sleep(0.1)
-        print(f"Solmate {client.serialnum}: {client.get_injection_settings()}")
-        sleep(0.1)
         print(f"Solmate {client.serialnum}: {client.set_min_injection(50)}")
-        sleep(0.1)
-        print(f"Solmate {client.serialnum}: {client.get_injection_settings()}")
-        sleep(0.1)
         print(f"Solmate {client.serialnum}: {client.set_max_injection(50)}")
-        sleep(0.1)
         print(f"Solmate {client.serialnum}: {client.get_injection_settings()}")
         sleep(10)
 
@@ -29,24 +29,22 @@ def run_continuously():
     while True:
         print(f"Solmate {client.serialnum}: {client.list_wifis()}")
         sleep(0.1)
-        print(f"Solmate {client.serialnum}: {client.get_live_values()}")
+        # one batched round-trip replaces the serialized live_values/grid_mode/
+        # user_settings/injection_settings chain; it hits the routes directly,
+        # so the values are always fresh
+        print(f"Solmate {client.serialnum}: {client.snapshot()}")
         sleep(0.1)
         print(f"Solmate {client.serialnum}: {client.get_recent_logs()}")
         sleep(0.1)
+        # get_software_version (like the other cached getters) serves from a
+        # 60 s TTL cache, so this print may lag by up to a minute
         print(f"Solmate {client.serialnum}: {client.get_software_version()}")
         sleep(0.1)
-        print(f"Solmate {client.serialnum}: {client.get_grid_mode()}")
-        sleep(0.1)
-        print(f"Solmate {client.serialnum}: {client.get_user_settings()}")
-        sleep(0.1)
-        print(f"Solmate {client.serialnum}: {client.get_injection_settings()}")
-        sleep(0.1)
         print(f"Solmate {client.serialnum}: {client.set_min_injection(0)}")
         sleep(0.1)
-        print(f"Solmate {client.serialnum}: {client.get_injection_settings()}")
-        sleep(0.1)
         print(f"Solmate {client.serialnum}: {client.set_max_injection(50)}")
         sleep(0.1)
+        # the setters invalidated the injection-settings cache, so this is fresh
         print(f"Solmate {client.serialnum}: {client.get_injection_settings()}")
         sleep(10)
 
@@ -1,2 +1,8 @@
 """Software Development Kit for the EET SolMate"""
-from .apiclient import SolMateAPIClient, LocalSolMateAPIClient
+from .apiclient import (
+    AsyncLocalSolMateAPIClient,
+    AsyncSolMateAPIClient,
+    LocalSolMateAPIClient,
+    SolMateAPIClient,
+    get_shared_client,
+)
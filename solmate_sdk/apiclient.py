@@ -1,18 +1,40 @@
 """Contains the high-level API client."""
 
 import asyncio
+import atexit
 import base64
+import datetime
+import functools
 import getpass
 import hashlib
-import json
+import os
 import pathlib
 import logging
+import socket
+import threading
+import time
+import weakref
 from typing import Optional
 
 import websockets.client
+import websockets.exceptions
+
+try:
+    # only used to build the SDK's own background loop; never uvloop.install(),
+    # which would swap the global policy under the user's feet
+    import uvloop
+except ImportError:  # uvloop is an optional speedup for the asyncio event loop
+    uvloop = None
 
 from .connection import SolConnection
-from .utils import BadRequest, ConnectionClosedOnPurpose, bad_request_handling, retry
+from .utils import (
+    BadRequest,
+    ConnectionClosedOnPurpose,
+    dumps,
+    loads,
+    retry,
+    ttl_cache,
+)
 
 CONFIG_DIRECTORY = pathlib.Path.home() / ".config" / "solmate-sdk"
 AUTHSTORE_FILE = CONFIG_DIRECTORY / "authstore.json"
@@ -21,18 +43,161 @@ LOCAL_AUTHSTORE_FILE = CONFIG_DIRECTORY / "local_authstore.json"
 LOCAL_ACCESS_DEVICE_ID = "local_webinterface"
 SOL_URI = "wss://sol.eet.energy:9124"
 
+_run_coroutine_threadsafe = asyncio.run_coroutine_threadsafe  # hoisted: looked up on every sync call
+_EMPTY: dict = {}  # shared payload of the no-argument routes; must never be mutated
+
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_LOOP_THREAD: Optional[threading.Thread] = None
+_AUTHSTORE_CACHE = {}  # path -> (mtime_ns, parsed contents)
+_AUTHSTORE_LOCKS = weakref.WeakKeyDictionary()  # event loop -> its authstore lock
+_CONN_POOL = {}  # (uri, serialnum, device_id, authenticated) -> parked healthy connections
+_CONN_POOL_SIZE = 2
+
 
-class SolMateAPIClient:
+def _load_authstore(path):
+    """Loads an authstore file, reusing the in-memory copy while the file is unchanged on disk.
+    Cached per path, since the regular and the local client use separate authstore files.
+    """
+    if not path.exists():
+        return {}
+    mtime = path.stat().st_mtime_ns
+    cached = _AUTHSTORE_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    authstore = loads(path.read_bytes())
+    _AUTHSTORE_CACHE[path] = (mtime, authstore)
+    return authstore
+
+
+def _store_authstore(path, authstore):
+    """Writes an authstore atomically (tmp file + rename) and refreshes the in-memory cache.
+    Skips the disk write entirely when the contents already match the stored file.
+    """
+    cached = _AUTHSTORE_CACHE.get(path)
+    if cached is not None and cached[1] == authstore and path.exists():
+        return
+    tmp = path.with_suffix(".tmp")
+    tmp.write_bytes(dumps(authstore))
+    os.replace(tmp, path)
+    _AUTHSTORE_CACHE[path] = (path.stat().st_mtime_ns, authstore)
+
+
+def _authstore_lock():
+    """Returns the lock serializing authstore read/modify/write cycles on the running loop.
+    An asyncio.Lock binds to one loop, and sync clients (shared background loop) may coexist
+    with asynchronous=True clients on their own loops, so each loop gets its own lock.
+    """
+    loop = asyncio.get_running_loop()
+    lock = _AUTHSTORE_LOCKS.get(loop)
+    if lock is None:
+        lock = _AUTHSTORE_LOCKS[loop] = asyncio.Lock()
+    return lock
+
+
+def _background_loop():
+    """Returns the shared long-lived event loop, starting its daemon thread on first use.
+    Keeping one loop alive across calls avoids per-request loop setup/teardown and keeps the
+    websocket connection (including its TCP/TLS state) warm between synchronous calls.
+    """
+    global _LOOP, _LOOP_THREAD  # pylint: disable=global-statement
+    if _LOOP is None:
+        _LOOP = asyncio.new_event_loop() if uvloop is None else uvloop.new_event_loop()
+        _LOOP_THREAD = threading.Thread(target=_LOOP.run_forever, name="solmate-sdk-eventloop", daemon=True)
+        _LOOP_THREAD.start()
+        atexit.register(_stop_background_loop)
+    return _LOOP
+
+
+def _stop_background_loop():
+    """Tears down the background event loop at interpreter exit.
+    Cancels whatever is still pending (reader tasks of parked connections), shuts down async
+    generators and closes the loop so its selector and self-pipe descriptors are released.
+    """
+    if _LOOP is None or not _LOOP.is_running():
+        return
+    # perform the websocket close handshake for parked connections while the loop still runs
+    for pool in _CONN_POOL.values():
+        while pool:
+            try:
+                _run_coroutine_threadsafe(pool.pop().close(), _LOOP).result(timeout=5)
+            except Exception:  # pylint: disable=broad-except
+                pass
+    for task in asyncio.all_tasks(_LOOP):
+        _LOOP.call_soon_threadsafe(task.cancel)
+    _LOOP.call_soon_threadsafe(_LOOP.stop)
+    _LOOP_THREAD.join(timeout=5)
+    if not _LOOP_THREAD.is_alive():
+        _LOOP.run_until_complete(_LOOP.shutdown_asyncgens())
+        _LOOP.close()
+
+
+def _sync_wrapper(clsname, name, async_method):
+    """Builds the synchronous wrapper that dispatches an async_ method onto the background loop."""
+
+    @functools.wraps(async_method)
+    def wrapper(self, *args, **kwargs):
+        return self._run(async_method(self, *args, **kwargs))
+
+    wrapper.__name__ = name
+    wrapper.__qualname__ = f"{clsname}.{name}"
+    return wrapper
+
+
+class _SyncWrapperMeta(type):
+    """Derives the synchronous API from the async_ methods.
+    For every async_foo defined on a class without a hand-written foo, a wrapper running the
+    coroutine on the background event loop is attached under the name foo, so the two method
+    families cannot drift apart.
+    """
+
+    def __new__(mcs, clsname, bases, namespace):
+        cls = super().__new__(mcs, clsname, bases, namespace)
+        for attr, value in list(namespace.items()):
+            if attr.startswith("async_") and callable(value):
+                sync_name = attr[len("async_") :]
+                if sync_name not in namespace:
+                    setattr(cls, sync_name, _sync_wrapper(clsname, sync_name, value))
+        return cls
+
+
+class SolMateAPIClient(metaclass=_SyncWrapperMeta):
     """Class-based Websocket API Client for the Sol and SolMate.
     This client provides synchronous and asynchronous endpoint methods.
-    Asynchronous methods start with async_.
+    Asynchronous methods start with async_, their synchronous counterparts are generated.
     """
 
-    def __init__(self, serialnum: str, uri=SOL_URI, asynchronous=False, logger=None):
+    __slots__ = (
+        "serialnum",
+        "protocol",
+        "compress",
+        "conn",
+        "authenticated",
+        "uri_verified",
+        "uri",
+        "device_id",
+        "authstore_file",
+        "eventloop",
+        "logger",
+        "_pw_hash_cache",
+        "_uri_changed",
+        "_auth_skeleton",
+        "_auth_payload_cache",
+        "_online_cache",
+        "_ttl_cache",
+    )
+
+    def __init__(
+        self, serialnum: str, uri=SOL_URI, asynchronous=False, logger=None, protocol="json", compress=False
+    ):
         """Initializes the instance given a serial number and auth_token (signature).
         Leaves the underlying connection object uninitialised.
+        protocol selects the wire codec ("json" by default, "msgpack" where the server supports it).
+        compress re-enables permessage-deflate, which is off by default since it costs more CPU
+        than it saves bytes on the typical sub-MTU frames.
         """
         self.serialnum: str = serialnum
+        self.protocol = protocol
+        self.compress: bool = compress
         self.conn: Optional[SolConnection] = None
         self.authenticated: bool = False
         self.uri_verified: bool = False
@@ -40,18 +205,36 @@ class SolMateAPIClient:
         self.device_id = DEFAULT_DEVICE_ID
         self.authstore_file = AUTHSTORE_FILE
         self.eventloop = None
+        self._pw_hash_cache = None
+        self._uri_changed = False
+        # shared skeleton of the auth-related payloads; the serial number never changes
+        self._auth_skeleton = {"serial_num": serialnum}
+        self._auth_payload_cache = None
+        self._online_cache = None
         if logger is None:
             logger = logging.getLogger("SolMate API client.")
         self.logger = logger
         if not asynchronous:
-            try:
-                self.eventloop = asyncio.get_event_loop()
-                if self.eventloop.is_closed():
-                    raise RuntimeError("The current event loop is closed.")
-            except RuntimeError:
-                # No event loop is currently running, so create a new one
-                self.eventloop = asyncio.new_event_loop()
-                asyncio.set_event_loop(self.eventloop)
+            self.eventloop = _background_loop()
+
+    def _run(self, coro):
+        """Runs a coroutine on the background event loop and waits for its result."""
+        return _run_coroutine_threadsafe(coro, self.eventloop).result()
+
+    def _pop_pooled(self, authenticated):
+        """Pops a healthy parked connection in the given auth state, if one exists.
+        Only connections living on the shared background loop are ever parked, so a
+        coroutine running on any other loop (asynchronous=True clients) gets nothing here -
+        a connection's reader task and transport are bound to the loop that created them.
+        """
+        if _LOOP is None or asyncio.get_running_loop() is not _LOOP:
+            return None
+        pool = _CONN_POOL.get((self.uri, self.serialnum, self.device_id, authenticated))
+        while pool:
+            conn = pool.pop()
+            if conn.sock.open:
+                return conn
+        return None
 
     async def async_connect(self):
         """Asynchronously attempts to connect to the server and initialize the client."""
@@ -62,48 +245,72 @@ class SolMateAPIClient:
             except Exception as e:
                 self.logger.error("Error while closing connection: %s", str(e))
 
+        # only connections parked in the same auth state are revived, so an unprotected
+        # connect() can never inherit an authenticated socket (or vice versa)
+        conn = self._pop_pooled(self.authenticated)
+        if conn is not None:
+            self.conn = conn
+            self.logger.debug("Reusing pooled connection to %s.", self.uri)
+            return
+
         self.logger.debug("Connecting to: %s", self.uri)
-        sock = await websockets.client.connect(self.uri)
+        # permessage-deflate costs more CPU than it saves on these sub-MTU JSON frames
+        # (opt back in via compress=True), and the generous size/buffer limits
+        # accommodate large log responses
+        # offer the binary codec via the subprotocol handshake so that servers
+        # without msgpack support transparently keep talking JSON
+        subprotocols = ["msgpack", "json"] if self.protocol == "msgpack" else None
+        sock = await websockets.client.connect(
+            self.uri,
+            compression="deflate" if self.compress else None,
+            max_size=None,
+            read_limit=2**20,
+            write_limit=2**20,
+            subprotocols=subprotocols,
+        )
+        codec = self.protocol
+        if codec == "msgpack" and sock.subprotocol != "msgpack":
+            self.logger.debug("Server did not accept the msgpack subprotocol, staying on json.")
+            codec = "json"
+        transport_sock = sock.transport.get_extra_info("socket")
+        if transport_sock is not None:
+            # disable Nagle so small JSON requests do not linger in the TCP stack,
+            # and enable keepalive so dead connections surface instead of hanging polls
+            transport_sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            transport_sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
         self.logger.debug("Socket connected.")
-        self.conn = SolConnection(sock)
+        self.conn = SolConnection(sock, codec=codec)
+        self.authenticated = False  # a fresh connection starts unauthenticated
         self.logger.info("Connected successfully.")
 
-    def connect(self):
-        """Synchronously attempts to connect to the server and initialize the client."""
-        self.eventloop.run_until_complete(self.async_connect())
-
     async def async_request(self, route, data):
-        """Synchronous method to make requests to the API."""
+        """Asynchronous method to make requests to the API.
+        Requests are multiplexed by id over the shared connection, so independent calls
+        may safely be combined with asyncio.gather (see also async_batch).
+        """
         if self.conn is None:
             raise RuntimeError("Connection has not yet been initialised.")
         return await self.conn.request(route, data)
 
-    def request(self, route, data):
-        """Synchronous method to make requests to the API."""
-        return self.eventloop.run_until_complete(self.async_request(route, data))
-
     async def async_login(self, user_password, device_id=DEFAULT_DEVICE_ID) -> str:
-        """Generates the authentication token from the serialnumber + password."""
+        """Generates the authentication token from the serialnumber + password.
+        The SHA-256 digest goes through hashlib's OpenSSL backend, which already uses the
+        hardware SHA extensions where the CPU provides them.
+        """
+        if self._pw_hash_cache is None or self._pw_hash_cache[0] != user_password:
+            # the stage-1 hash of the user password, computed once per password
+            digest = base64.b64encode(hashlib.sha256(user_password.encode("utf-8")).digest()).decode()
+            self._pw_hash_cache = (user_password, digest)
         try:
             response = await self.async_request(
                 "login",
-                {
-                    "serial_num": self.serialnum,
-                    "user_password_hash": base64.encodebytes(
-                        hashlib.sha256(user_password.encode()).digest()
-                    ).decode(),  # the stage-1 hash of the user password
-                    "device_id": device_id,
-                },
+                {**self._auth_skeleton, "user_password_hash": self._pw_hash_cache[1], "device_id": device_id},
             )
         except BadRequest as err:
             raise err
         if not response["success"]:
             raise RuntimeError("Unauthenticated :(")
         return response["signature"]
-    
-    def login(self, user_password, device_id=DEFAULT_DEVICE_ID) -> str:
-        """Generates the authentication token from the serialnumber + password."""
-        return self.eventloop.run_until_complete(self.async_login(user_password, device_id))
 
     async def async_check_uri(self, auth_token, device_id): 
         """Handles redirections using verification of uri and dummy request gaining redirection info"""
@@ -112,154 +319,279 @@ class SolMateAPIClient:
             try:
                 data = await self.async_request(
                     "authenticate",
-                    {
-                        "serial_num": self.serialnum,
-                        "signature": auth_token,
-                        "device_id": device_id,
-                    },
+                    {**self._auth_skeleton, "signature": auth_token, "device_id": device_id},
                 )
-                self.logger.debug(data)
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("auth_resp=%r", data)
                 if not data["redirect"] in (self.uri, None):
                     self.logger.debug("Redirected - switching to new uri - uri of SolMate changed retry whatever you have done")
+                    self._uri_changed = True
                     self.uri = data["redirect"]
                     self.logger.debug("New uri %s", self.uri)
                     self.uri_verified = True
                 else:
+                    self._uri_changed = False
                     self.uri_verified = True
             except BadRequest as err:
                 raise ValueError("Invalid Serial Number?") from err
 
-    def check_uri(self, auth_token, device_id):
-        """Handles redirections using verification of uri and dummy request gaining redirection info"""
-        return self.eventloop.run_until_complete(self.async_check_uri(auth_token, device_id))
-
     async def async_authenticate(self, auth_token, device_id=DEFAULT_DEVICE_ID):
         """Given the authentication token, try to authenticate this websocket connection.
         Subsequent method calls to protected methods are unlocked this way.
         """
+        if self._auth_payload_cache is None or self._auth_payload_cache[0] != (auth_token, device_id):
+            # retry-driven re-authentication reuses the prebuilt payload
+            payload = {**self._auth_skeleton, "signature": auth_token, "device_id": device_id}
+            self._auth_payload_cache = ((auth_token, device_id), payload)
         try:
-            await self.async_request(
-                "authenticate",
-                {
-                    "serial_num": self.serialnum,
-                    "signature": auth_token,
-                    "device_id": device_id,
-                },
-            )
+            await self.async_request("authenticate", self._auth_payload_cache[1])
         except BadRequest as err:
             raise ValueError("Invalid Serial Number?") from err
-
-    def authenticate(self, auth_token, device_id=DEFAULT_DEVICE_ID):
-        """Given the authentication token, try to authenticate this websocket connection.
-        Subsequent method calls to protected methods are unlocked this way.
-        """
-        return self.eventloop.run_until_complete(self.async_authenticate(auth_token, device_id))
+        self.authenticated = True
 
     async def async_quickstart(self, password=None, device_id=DEFAULT_DEVICE_ID, store_auth_token_in_file=True):
         """Connect, login, authenticate and store the token for future use async!"""
+        if self.conn is None:
+            # a connection parked by close() after authenticate skips the whole handshake
+            conn = self._pop_pooled(True)
+            if conn is not None:
+                self.conn = conn
+                self.authenticated = True
+                self.uri_verified = True
+                self.logger.debug("Reusing pooled authenticated connection to %s.", self.uri)
+                return
         await self.async_connect()
-        token: Optional[str] = None
-        if self.authstore_file.exists():
-            with open(self.authstore_file, encoding="utf-8") as file:
-                authstore = json.load(file)
-            if self.serialnum in authstore:
-                token = authstore[self.serialnum]
-        else:
-            authstore = {}
-        if token is None:
-            if not password:
-                print(f"Please enter the user password of your SolMate {self.serialnum}.")
-                print(f"The credentials will be stored for future use in {self.authstore_file}.")
-                password = getpass.getpass("Your SolMate's user password: ")
-            token = await self.async_login(password, device_id)
-            if store_auth_token_in_file:
-                CONFIG_DIRECTORY.mkdir(parents=True, exist_ok=True)
-                with open(self.authstore_file, "w", encoding="utf-8") as file:
-                    authstore[self.serialnum] = token
-                    json.dump(authstore, file)
-                self.logger.debug("Stored credentials of %s.", self.serialnum)
-                self.logger.debug("Already stored credentials are: %s", [sn for sn in authstore.keys()])
+        lock = _authstore_lock()
+        async with lock:
+            # copy, so the cached dict is not mutated before the comparison in _store_authstore
+            authstore = dict(_load_authstore(self.authstore_file))
+            entry = authstore.get(self.serialnum)
+            if isinstance(entry, dict):
+                token: Optional[str] = entry.get("token")
+                stored_uri = entry.get("uri")
+            else:  # legacy schema: the entry is the plain token string
+                token = entry
+                stored_uri = None
+            if token is None:
+                if not password:
+                    print(f"Please enter the user password of your SolMate {self.serialnum}.")
+                    print(f"The credentials will be stored for future use in {self.authstore_file}.")
+                    password = getpass.getpass("Your SolMate's user password: ")
+                token = await self.async_login(password, device_id)
+        used_stored_uri = False
+        if stored_uri is not None and not self.uri_verified:
+            # the redirect target is known from a previous run, connect to it directly
+            self.logger.debug("Using stored redirect uri %s", stored_uri)
+            try:
+                if stored_uri != self.uri:
+                    self.uri = stored_uri
+                    await self.async_connect()
+                self.uri_verified = True
+                used_stored_uri = True
+            except (OSError, asyncio.TimeoutError, websockets.exceptions.WebSocketException):
+                # the stored redirect target no longer accepts connections (device moved
+                # back, balancer reshuffled); rediscover from the default uri instead
+                self.logger.debug("Stored uri %s unreachable, re-checking from %s", stored_uri, SOL_URI)
+                self.uri = SOL_URI
+                self.uri_verified = False
+                await self.async_connect()
         if not self.uri_verified:
             self.logger.debug("Checking uri for redirection - SolMate might be on a different port")
             await self.async_check_uri(token, device_id)
-            await self.async_connect()  # Connect to redirection address
-        await self.async_authenticate(token, device_id)
+            if self._uri_changed:
+                await self.async_connect()  # Connect to the redirection address
+        try:
+            await self.async_authenticate(token, device_id)
+        except ValueError:
+            if not used_stored_uri:
+                raise
+            # the stored redirect target went stale (device moved back, balancer
+            # reshuffled); rediscover the uri from scratch before giving up
+            self.logger.debug("Stored uri %s rejected the signature, re-checking from %s", self.uri, SOL_URI)
+            self.uri = SOL_URI
+            self.uri_verified = False
+            await self.async_connect()
+            await self.async_check_uri(token, device_id)
+            if self._uri_changed:
+                await self.async_connect()
+            await self.async_authenticate(token, device_id)
+        if store_auth_token_in_file:
+            async with lock:
+                CONFIG_DIRECTORY.mkdir(parents=True, exist_ok=True)
+                authstore = dict(_load_authstore(self.authstore_file))
+                authstore[self.serialnum] = {"token": token, "uri": self.uri}
+                _store_authstore(self.authstore_file, authstore)
+                self.logger.debug("Stored credentials of %s.", self.serialnum)
+                self.logger.debug("Already stored credentials are: %s", list(authstore))
 
-    def quickstart(self, password=None, device_id=DEFAULT_DEVICE_ID, store_auth_token_in_file=True):
-        """Connect, login, authenticate and store the token for future use!"""
-        self.eventloop.run_until_complete(self.async_quickstart(password, device_id, store_auth_token_in_file))
 
+    async def async_batch(self, calls):
+        """Issues several (route, data) requests concurrently over the single websocket
+        connection and returns their results in call order. The frames are sent in one
+        burst, so a batch costs roughly one round-trip.
+        """
+        if self.conn is None:
+            raise RuntimeError("Connection has not yet been initialised.")
+        return await self.conn.request_many(calls)
 
-    @bad_request_handling()
+    async def async_snapshot(self):
+        """Fetches live values, grid mode, user settings and injection settings concurrently.
+        The requests share the websocket connection and complete in roughly one round-trip.
+        """
+        live_values, grid_mode, user_settings, injection_settings = await self.async_batch(
+            [
+                ("live_values", _EMPTY),
+                ("get_grid_mode", _EMPTY),
+                ("get_user_settings", _EMPTY),
+                ("get_injection_settings", _EMPTY),
+            ]
+        )
+        return {
+            "live_values": live_values,
+            "grid_mode": grid_mode,
+            "user_settings": user_settings,
+            "injection_settings": injection_settings,
+        }
+
+    def _invalidate_cache(self, *method_names):
+        """Drops the TTL-cached results of the given methods after a setting changed."""
+        cache = getattr(self, "_ttl_cache", None)
+        if cache:
+            for key in [key for key in cache if key[0] in method_names]:
+                del cache[key]
+
+    @ttl_cache(60)
     def get_software_version(self):
         """Returns the actually installed software version"""
-        return self.request("get_solmate_info", {})
+        try:
+            return self.request("get_solmate_info", _EMPTY)
+        except BadRequest:
+            self.logger.warning("The get_solmate_info route is not supported on this SolMate yet")
+            return None
 
     @retry(2, BadRequest, 1)
     def get_live_values(self):
         """Return current live values of the respective SolMate as a dictionary (pv power, battery state, injection)."""
-        return self.request("live_values", {})
+        return self.request("live_values", _EMPTY)
+
+    async def async_get_live_values(self):
+        """Asynchronous variant of get_live_values."""
+        return await self.async_request("live_values", _EMPTY)
 
     def get_recent_logs(self, days=None, start_time=None):
         """Returns the latest logs on the sol server"""
-        import datetime
-
-        if not days:
-            days = 1
-        if not start_time:
-            start_time = datetime.datetime.now() - datetime.timedelta(days)
+        days = days or 1
+        start_time = start_time or (datetime.datetime.now() - datetime.timedelta(days))
         end_time = start_time + datetime.timedelta(days)
         return self.request(
             "logs",
-            {"timeframes": [{"start": start_time.isoformat()[:19], "end": end_time.isoformat()[:19], "resolution": 4}]},
+            {
+                "timeframes": [
+                    {
+                        "start": start_time.isoformat(timespec="seconds")[:19],
+                        "end": end_time.isoformat(timespec="seconds")[:19],
+                        "resolution": 4,
+                    }
+                ]
+            },
         )
 
     def get_milestones_savings(self, days=1):
         """Returns the latest milestones saving"""
         return self.request("milestones_savings", {"days": days})
 
+    @ttl_cache(60)
     def get_user_settings(self):
         """Returns user settings which are valid at the moment"""
-        return self.request("get_user_settings", {})
+        return self.request("get_user_settings", _EMPTY)
 
+    @ttl_cache(60)
     def get_injection_settings(self):
         """Shows your injection settings."""
-        return self.request("get_injection_settings", {})
+        return self.request("get_injection_settings", _EMPTY)
 
+    @ttl_cache(60)
     def get_grid_mode(self):
         """Returns grid mode i.e. Offgrid mode ('island mode') or Ongrid mode"""
-        return self.request("get_grid_mode", {})
+        return self.request("get_grid_mode", _EMPTY)
+
+    def _cached_online(self):
+        """Returns the cached check_online result while it is fresh (a few seconds), else None.
+        Traffic on our websocket only proves the link to the server is alive, not that the
+        SolMate itself is, so only actual check_online answers are cached.
+        """
+        hit = self._online_cache
+        if hit is not None and time.monotonic() < hit[0]:
+            return hit[1]
+        return None
 
     def check_online(self):
         """Check whether the respective SolMate is currently online."""
-        return self.request("check_online", {"serial_num": self.serialnum})["online"]
+        online = self._cached_online()
+        if online is None:
+            online = bool(self.request("check_online", {"serial_num": self.serialnum}).get("online", False))
+            self._online_cache = (time.monotonic() + 5, online)
+        return online
+
+    async def async_check_online(self):
+        """Asynchronous variant of check_online."""
+        online = self._cached_online()
+        if online is None:
+            resp = await self.async_request("check_online", {"serial_num": self.serialnum})
+            online = bool(resp.get("online", False))
+            self._online_cache = (time.monotonic() + 5, online)
+        return online
 
     def set_max_injection(self, maximum_power):
         """Sets user defined maximum injection power which is applied if SolMates battery is ok with it"""
-        return self.request("set_user_maximum_injection", {"injection": maximum_power})
+        response = self.request("set_user_maximum_injection", {"injection": maximum_power})
+        self._invalidate_cache("get_injection_settings")
+        return response
 
-    @bad_request_handling()
     def set_min_injection(self, minimum_power):
         """Sets user defined minimum injection power which is applied if SolMates battery is ok with it"""
-        return self.request("set_user_minimum_injection", {"injection": minimum_power})
+        try:
+            response = self.request("set_user_minimum_injection", {"injection": minimum_power})
+        except BadRequest:
+            self.logger.warning("The set_user_minimum_injection route is not supported on this SolMate yet")
+            return None
+        self._invalidate_cache("get_injection_settings")
+        return response
 
     def set_min_battery_percentage(self, minimum_percentage):
         """Sets user defined minimum battery percentage"""
-        return self.request("set_user_minimum_battery_percentage", {"battery_percentage": minimum_percentage})
+        response = self.request("set_user_minimum_battery_percentage", {"battery_percentage": minimum_percentage})
+        self._invalidate_cache("get_user_settings")
+        return response
+
+    async def async_set_all(self, *, max_injection=None, min_injection=None, min_battery_percentage=None):
+        """Applies several user settings concurrently; fields left at None are not touched.
+        The requests share the websocket connection, so setting all three costs about one round-trip.
+        """
+        calls = []
+        if max_injection is not None:
+            calls.append(("set_user_maximum_injection", {"injection": max_injection}))
+        if min_injection is not None:
+            calls.append(("set_user_minimum_injection", {"injection": min_injection}))
+        if min_battery_percentage is not None:
+            calls.append(("set_user_minimum_battery_percentage", {"battery_percentage": min_battery_percentage}))
+        responses = await self.async_batch(calls)
+        self._invalidate_cache("get_injection_settings", "get_user_settings")
+        return responses
 
     def set_AP_mode(self):
         """This function opens the local Access Point (AP) of SolMate and leaves client (CLI) mode. This means you will
         have to connect to your SolMates WIFI "SolMate <serialnumber>". However, if SolMate has a wired connection as
         well online availability remains"""
-        return self.request("revert_to_ap", {})
+        return self.request("revert_to_ap", _EMPTY)
 
     def get_api_info(self):
         """Query all the available api calls."""
-        self.request("get_api_info", {})
+        self.request("get_api_info", _EMPTY)
 
     def get_boost_injection(self):
         """Get the boost injection settings from the solmate."""
-        return self.request("get_boost_injection", {})
+        return self.request("get_boost_injection", _EMPTY)
 
     def set_boost_injection(self, set_time_in_secs: int, set_wattage: int):
         """
@@ -268,9 +600,10 @@ class SolMateAPIClient:
         """
         return self.request("set_boost_injection", {"time": set_time_in_secs, "wattage": set_wattage})
 
+    @ttl_cache(60)
     def get_injection_profiles(self):
         """Get all the injection profiles from the solmate."""
-        return self.request("get_injection_profiles", {})
+        return self.request("get_injection_profiles", _EMPTY)
 
     def set_injection_profiles(self, new_injection_profiles: dict, new_injection_profiles_timestamp: str):
         """
@@ -279,23 +612,40 @@ class SolMateAPIClient:
         in "%Y-%m-%dT%H:%M:%S.%fZ" which is defined in solmate-sdk/utils.py as DATETIME_FORMAT_INJECTION_PROFILES for
         convenience.
         """
-        return self.request(
+        response = self.request(
             "set_injection_profiles",
             {
                 "injection_profiles": new_injection_profiles,
                 "injection_profiles_timestamp": new_injection_profiles_timestamp,
             },
         )
+        self._invalidate_cache("get_injection_profiles")
+        return response
 
     def apply_injection_profile(self, injection_profile_id: str):
         """Apply the injection profile with the id of 'injection_profile_id'."""
-        return self.request("apply_injection_profile", {"id": injection_profile_id})
-
-    def close(self):
-        """Correctly close the underlying connection."""
+        response = self.request("apply_injection_profile", {"id": injection_profile_id})
+        self._invalidate_cache("get_injection_profiles", "get_injection_settings")
+        return response
+
+    def close(self, discard=False):
+        """Correctly close the underlying connection.
+        Healthy sockets are parked in a small pool, keyed by their auth state, and revived
+        by the next connect() in the same state, skipping the TCP/TLS/websocket handshakes.
+        Pass discard=True to skip the pool and perform the websocket close handshake.
+        """
         if self.conn is None:
             raise RuntimeError("Connection has not yet been initialised.")
-        asyncio.get_event_loop().run_until_complete(self.conn.close())
+        # only connections on the shared background loop are parked; a connection of an
+        # asynchronous=True client is bound to its own (possibly already closed) loop
+        if not discard and _LOOP is not None and self.eventloop is _LOOP and self.conn.sock.open:
+            pool = _CONN_POOL.setdefault((self.uri, self.serialnum, self.device_id, self.authenticated), [])
+            if len(pool) < _CONN_POOL_SIZE:
+                pool.append(self.conn)
+                self.conn = None
+                return
+        self._run(self.conn.close())
+        self.conn = None
 
 
 class LocalSolMateAPIClient(SolMateAPIClient):
@@ -307,6 +657,8 @@ class LocalSolMateAPIClient(SolMateAPIClient):
     file (if you tested the online API first)
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.device_id = LOCAL_ACCESS_DEVICE_ID
@@ -315,7 +667,7 @@ class LocalSolMateAPIClient(SolMateAPIClient):
 
     def list_wifis(self):
         """Lists actually available and non hidden SSIDs"""
-        return self.request("list_wifis", {})
+        return self.request("list_wifis", _EMPTY)
 
     def connect_to_wifi(self, ssid, password):
         """Switches to other ssid or to the same - THE ACTUAL CONNECTION WILL BE BROKEN AFTER THAT
@@ -328,3 +680,24 @@ class LocalSolMateAPIClient(SolMateAPIClient):
         The local api has no check_online route, it is online if you can connect to the local uri.
         Please call connect() or quickstart(...) before."""
         return self.conn != None
+
+
+# The clients are natively async (the async_ methods); these aliases serve callers that
+# expect a dedicated async client class, without adding a wrapper frame per call.
+AsyncSolMateAPIClient = SolMateAPIClient
+AsyncLocalSolMateAPIClient = LocalSolMateAPIClient
+
+_SHARED_CLIENTS = {}
+
+
+def get_shared_client(serialnum: str, uri=SOL_URI) -> SolMateAPIClient:
+    """Returns an already quickstarted client for this serial number, creating it on first use.
+    Reusing the instance (and its authenticated websocket) within a process avoids repeating
+    the TLS handshake, websocket upgrade and authentication round-trips.
+    """
+    client = _SHARED_CLIENTS.get((serialnum, uri))
+    if client is None:
+        client = SolMateAPIClient(serialnum, uri)
+        client.quickstart()
+        _SHARED_CLIENTS[(serialnum, uri)] = client
+    return client
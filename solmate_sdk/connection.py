@@ -1,37 +1,130 @@
 """The SolConnection class, used by the API Client."""
 
 import asyncio
-import json
+import itertools
+import time
 
 import websockets.client
 
-from .utils import BadRequest, MoreCapableEncoder
+from .utils import BadRequest, _json_default, dumps, loads
+
+try:
+    import msgpack
+except ImportError:  # msgpack framing is opt-in, JSON is always available
+    msgpack = None
 
 
 class SolConnection:
     """Underlying Connection Object to a Sol API endpoint. Do not use directly."""
 
-    def __init__(self, sock: websockets.client.WebSocketClientProtocol):
-        """Initializes with a socket object and request id counter."""
+    __slots__ = ("sock", "codec", "last_recv", "_reqid", "_pending", "_reader_task", "_route_cache")
+
+    def __init__(self, sock: websockets.client.WebSocketClientProtocol, codec="json"):
+        """Initializes with a socket object, request id counter and response routing table.
+        codec may be "json" (the default) or "msgpack" for binary frames, which are smaller
+        and cheaper to encode/decode but require server support.
+        """
+        if codec == "msgpack" and msgpack is None:
+            raise RuntimeError("The msgpack codec requires the msgpack package to be installed.")
         self.sock = sock
-        self._nextreqid = 0
+        self.codec = codec
+        self.last_recv = 0.0  # monotonic timestamp of the last received response
+        self._reqid = itertools.count(1).__next__  # C-level counter, no method call per request
+        self._pending = {}
+        self._reader_task = None
+        self._route_cache = {}  # route -> its encoded JSON string literal
+
+    def _encode(self, route, reqid, data):
+        """Builds an outgoing request frame with the negotiated codec.
+        For JSON the three-key envelope is spliced around a cached route literal, so only
+        the data payload goes through the encoder; the result stays a text frame.
+        """
+        if self.codec == "msgpack":
+            return msgpack.packb({"route": route, "id": reqid, "data": data}, default=_json_default)
+        route_json = self._route_cache.get(route)
+        if route_json is None:
+            route_json = self._route_cache[route] = dumps(route).decode()
+        return '{"route":%s,"id":%d,"data":%s}' % (route_json, reqid, dumps(data).decode())
+
+    def _decode(self, raw):
+        """Decodes an incoming frame with the negotiated codec."""
+        if self.codec == "msgpack":
+            return msgpack.unpackb(raw)
+        return loads(raw)
+
+    def _ensure_reader(self):
+        """Starts the background reader task on first use (or restarts it after a failure)."""
+        if self._reader_task is None or self._reader_task.done():
+            self._reader_task = asyncio.ensure_future(self._read_loop())
+
+    async def _read_loop(self):
+        """Reads responses off the socket and routes each to the matching pending request.
+        Responses are matched by their echoed request id; a response without a known id resolves
+        the oldest pending request, which preserves the previous strictly-sequential behaviour.
+        """
+        try:
+            while True:
+                response = self._decode(await self.sock.recv())
+                self.last_recv = time.monotonic()
+                future = self._pending.pop(response.get("id"), None)
+                if future is None and self._pending:
+                    future = self._pending.pop(next(iter(self._pending)))
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except Exception as exc:  # pylint: disable=broad-except
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(exc)
+            self._pending.clear()
 
     async def request(self, route, data, timeout=30):
         """Issues a request to Sol/SolMate.
         When the timeout passes, an asyncio.TimeoutError will be raised.
+        Several requests may be in flight on the same socket at once (e.g. via asyncio.gather).
         """
-        reqid = self.reqid_counter()
-        await self.sock.send(json.dumps({"route": route, "id": reqid, "data": data}, cls=MoreCapableEncoder))
-        response = json.loads(await asyncio.wait_for(self.sock.recv(), timeout))
+        reqid = self._reqid()
+        future = asyncio.get_running_loop().create_future()
+        self._pending[reqid] = future
+        self._ensure_reader()
+        try:
+            await self.sock.send(self._encode(route, reqid, data))
+            response = await asyncio.wait_for(future, timeout)
+        finally:
+            self._pending.pop(reqid, None)
         if "error" in response:
             raise BadRequest(response["error"])
         return response["data"]
 
-    def reqid_counter(self):
-        """Internal counter for request ids. In principle, this could be anything."""
-        self._nextreqid += 1
-        return self._nextreqid
+    async def request_many(self, calls, timeout=30):
+        """Issues several (route, data) requests over the socket in one burst.
+        All frames are sent back-to-back before any response is awaited, so N calls cost
+        roughly one round trip; results come back in call order.
+        """
+        loop = asyncio.get_running_loop()
+        reqids = []
+        futures = []
+        self._ensure_reader()
+        try:
+            for route, data in calls:
+                reqid = self._reqid()
+                future = self._pending[reqid] = loop.create_future()
+                futures.append(future)
+                reqids.append(reqid)
+                await self.sock.send(self._encode(route, reqid, data))
+            responses = await asyncio.wait_for(asyncio.gather(*futures), timeout)
+        finally:
+            for reqid in reqids:
+                self._pending.pop(reqid, None)
+        results = []
+        for response in responses:
+            if "error" in response:
+                raise BadRequest(response["error"])
+            results.append(response["data"])
+        return results
 
     async def close(self, reason=""):
-        """Close the socket."""
+        """Close the socket and stop the reader task."""
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            self._reader_task = None
         await self.sock.close(code=1000, reason=reason)
@@ -1,7 +1,11 @@
 """Unit tests for the API Client."""
 
+import asyncio
+import json
 import unittest
+
 from .apiclient import SolMateAPIClient
+from .connection import SolConnection
 
 
 class BasicUsageTest(unittest.TestCase):
@@ -22,3 +26,93 @@ class BasicUsageTest(unittest.TestCase):
         client = SolMateAPIClient(self.serial_num)
         client.quickstart()
         print(f"Live values: {client.get_live_values()}")
+
+
+class _FakeSock:
+    """A minimal stand-in for the websocket, feeding scripted frames to the reader task."""
+
+    def __init__(self):
+        self.open = True
+        self.sent = []
+        self._frames = asyncio.Queue()
+
+    async def send(self, frame):
+        self.sent.append(json.loads(frame))
+
+    async def recv(self):
+        return await self._frames.get()
+
+    async def close(self, code=1000, reason=""):
+        self.open = False
+
+    def feed(self, message):
+        self._frames.put_nowait(json.dumps(message))
+
+
+class SolConnectionTest(unittest.TestCase):
+    """Tests the request multiplexing of SolConnection against a fake socket."""
+
+    def test_out_of_order_responses(self):
+        """Responses are routed to their request by id, regardless of arrival order."""
+
+        async def scenario():
+            sock = _FakeSock()
+            conn = SolConnection(sock)
+            first = asyncio.ensure_future(conn.request("a", {}))
+            second = asyncio.ensure_future(conn.request("b", {}))
+            while len(sock.sent) < 2:  # both frames on the wire before answering
+                await asyncio.sleep(0)
+            sock.feed({"id": sock.sent[1]["id"], "data": "B"})
+            sock.feed({"id": sock.sent[0]["id"], "data": "A"})
+            results = (await first, await second)
+            await conn.close()
+            return results
+
+        self.assertEqual(asyncio.run(scenario()), ("A", "B"))
+
+    def test_no_id_fallback(self):
+        """A response without an id resolves the oldest pending request (legacy servers)."""
+
+        async def scenario():
+            sock = _FakeSock()
+            conn = SolConnection(sock)
+            pending = asyncio.ensure_future(conn.request("a", {}))
+            while not sock.sent:
+                await asyncio.sleep(0)
+            sock.feed({"data": "legacy"})
+            result = await pending
+            await conn.close()
+            return result
+
+        self.assertEqual(asyncio.run(scenario()), "legacy")
+
+    def test_timeout_cleans_up_pending(self):
+        """A timed-out request leaves no stale future in the pending table."""
+
+        async def scenario():
+            sock = _FakeSock()
+            conn = SolConnection(sock)
+            with self.assertRaises(asyncio.TimeoutError):
+                await conn.request("a", {}, timeout=0.01)
+            pending_after = dict(conn._pending)
+            await conn.close()
+            return pending_after
+
+        self.assertEqual(asyncio.run(scenario()), {})
+
+    def test_request_many_keeps_call_order(self):
+        """request_many returns results in call order even when responses interleave."""
+
+        async def scenario():
+            sock = _FakeSock()
+            conn = SolConnection(sock)
+            batch = asyncio.ensure_future(conn.request_many([("a", {}), ("b", {}), ("c", {})]))
+            while len(sock.sent) < 3:
+                await asyncio.sleep(0)
+            for frame in reversed(sock.sent):
+                sock.feed({"id": frame["id"], "data": frame["route"]})
+            results = await batch
+            await conn.close()
+            return results
+
+        self.assertEqual(asyncio.run(scenario()), ["a", "b", "c"])
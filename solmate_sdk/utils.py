@@ -8,30 +8,66 @@ import json
 import time
 from websockets import ConnectionClosed
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup, the stdlib is always available as fallback
+    orjson = None
+
 DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
 DATETIME_FORMAT_INJECTION_PROFILES = "%Y-%m-%dT%H:%M:%S.%fZ"
 
 
-def bad_request_handling():
-    """A decorator that deals with BadRequest exceptions"""
+def bad_request_handling(num_retries=2, delay=1.0):
+    """A decorator that deals with BadRequest exceptions.
+    Retries num_retries times with an exponentially growing delay, giving up with None
+    when the route is simply not supported by the SolMate.
+    """
 
     def decorator(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            delay = 1
+            current_delay = delay
             r = 0
-            num_retries = 2
             while True:
                 try:
                     return func(*args, **kwargs)
-                except BadRequest as exc:
+                except BadRequest:  # not re-raised, so skip the as-binding and its teardown
                     r += 1
-                    if delay:
-                        time.sleep(delay)
                     if r >= num_retries:
                         print("This route is not supported on this SolMate yet")
                         break
+                    if current_delay:
+                        time.sleep(current_delay)
+                        current_delay *= 2  # back off, the server is already struggling
+
+        return wrapper
+
+    return decorator
+
+
+def ttl_cache(seconds):
+    """A decorator that caches a method's result on its instance for a number of seconds.
+    Intended for read-mostly endpoints; entries live in the instance's _ttl_cache dict,
+    keyed by method name and arguments, so setters can invalidate them by name.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            cache = getattr(self, "_ttl_cache", None)
+            if cache is None:
+                cache = self._ttl_cache = {}
+            key = (func.__name__, args, tuple(sorted(kwargs.items())))
+            hit = cache.get(key)
+            now = time.monotonic()
+            if hit is not None and hit[0] > now:
+                return hit[1]
+            value = func(self, *args, **kwargs)
+            cache[key] = (now + seconds, value)
+            return value
+
         return wrapper
+
     return decorator
 
 
@@ -73,5 +109,35 @@ class MoreCapableEncoder(json.JSONEncoder):
     def default(self, o):
         """Extends the method of the base class"""
         if isinstance(o, datetime.datetime):
-            return o.strftime(DATETIME_FORMAT)
+            # same string as strftime(DATETIME_FORMAT), but via the C fast path;
+            # the slice drops the utc offset that aware datetimes would append
+            return o.isoformat(timespec="seconds")[:19]
         return super().default(o)
+
+
+def _json_default(o):
+    """Mirrors MoreCapableEncoder.default as a plain function for the dumps fast paths."""
+    if isinstance(o, datetime.datetime):
+        # same string as strftime(DATETIME_FORMAT), but via the C fast path;
+        # the slice drops the utc offset that aware datetimes would append
+        return o.isoformat(timespec="seconds")[:19]
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+# passing default= (instead of cls=) keeps json.dumps on its cached C encoder,
+# and the partial avoids rebuilding the keyword arguments per call
+_stdlib_dumps = functools.partial(json.dumps, default=_json_default, separators=(",", ":"))
+
+
+def dumps(obj) -> bytes:
+    """Serializes an object to JSON bytes, via orjson when installed (several times faster)."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_PASSTHROUGH_DATETIME)
+    return _stdlib_dumps(obj).encode()
+
+
+def loads(data):
+    """Deserializes JSON from str or bytes, via orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)